@@ -199,8 +199,12 @@ class RandomCrosser:
 
         """
 
-        crosser = self._generator.choice(
-            a=self._crossers,
-            p=self._weights,
-        )
+        # Picking an index avoids converting the crossers into a
+        # numpy object array on every call.
+        crosser = self._crossers[
+            self._generator.choice(
+                a=len(self._crossers),
+                p=self._weights,
+            )
+        ]
         return crosser.cross(records)
@@ -7,6 +7,8 @@ Genetic Recombination
 import itertools as it
 from collections import defaultdict
 
+from stk.utilities import dedupe
+
 from ....molecule_records import MoleculeRecord
 from ...records import CrossoverRecord
 from .crosser import MoleculeCrosser
@@ -106,7 +108,16 @@ class GeneticRecombination(MoleculeCrosser):
     building blocks are used to construct the offspring. The
     topology graph of the offspring is one of the parent's.
     For obvious reasons, this approach works with any number of
-    parents.
+    parents. Offspring whose building block map replaces nothing
+    are not produced. Building blocks are compared by identity, so a
+    building block mapped to an equal, but different, object counts
+    as replaced. Offspring identical to a parent can also still be
+    produced from the topology graph of another parent.
+
+    The crosser remembers every offspring it has produced. If the
+    same topology graph is given the same building blocks again, the
+    record of the earlier offspring is yielded, so that its molecule
+    is only constructed once.
 
     Examples
     --------
@@ -208,48 +219,95 @@ class GeneticRecombination(MoleculeCrosser):
 
         self._get_gene = get_gene
         self._name = name
+        # Maps a parent topology graph and the building blocks given
+        # to it, to the record of the offspring.
+        self._offspring = {}
 
     def cross(self, records):
-        topology_graphs = (
-            record.get_topology_graph() for record in records
+        # Parents sharing a topology graph would produce the same
+        # offspring from it, so each graph is used only once. The
+        # building blocks of each graph are collected up front, as
+        # they are needed by every offspring made from the graph.
+        topology_graphs = tuple(
+            (graph, tuple(graph.get_building_blocks()))
+            for graph in dedupe(
+                record.get_topology_graph() for record in records
+            )
         )
-        for topology_graph, alleles in it.product(
-            topology_graphs,
-            self._get_alleles(records),
-        ):
-
-            def get_replacement(building_block):
-                gene = self._get_gene(building_block)
-                return next(
-                    allele
-                    for allele in alleles
-                    if self._get_gene(allele) == gene
+        # Get the gene of each building block only once, rather than
+        # every time a building block is replaced.
+        genes = {
+            building_block: self._get_gene(building_block)
+            for _, building_blocks in topology_graphs
+            for building_block in building_blocks
+        }
+        allele_combinations = tuple(self._get_alleles(genes))
+        for topology_graph, building_blocks in topology_graphs:
+            for alleles in allele_combinations:
+                building_block_map = {
+                    building_block: alleles[genes[building_block]]
+                    for building_block in building_blocks
+                }
+                # If no building block gets replaced, the offspring is
+                # a copy of a parent, so there is no point
+                # constructing it.
+                if _is_unchanged(building_block_map):
+                    continue
+
+                key = (topology_graph, *building_block_map.values())
+                record = self._offspring.get(key)
+                if record is None:
+                    offspring = topology_graph.with_building_blocks(
+                        building_block_map=building_block_map,
+                    )
+                    record = self._offspring[key] = MoleculeRecord(
+                        topology_graph=offspring,
+                    )
+                yield CrossoverRecord(
+                    molecule_record=record,
+                    crosser_name=self._name,
                 )
 
-            topology_graph = topology_graph.with_building_blocks(
-                building_block_map={
-                    building_block: get_replacement(building_block)
-                    for building_block in topology_graph.get_building_blocks()
-                },
-            )
-            yield CrossoverRecord(
-                molecule_record=MoleculeRecord(
-                    topology_graph=topology_graph,
-                ),
-                crosser_name=self._name,
-            )
-
-    def _get_alleles(self, records):
+    def _get_alleles(self, genes):
         """
         Yield every possible combination of alleles.
 
+        Parameters
+        ----------
+        genes : :class:`dict`
+            Maps every building block of the parents to its gene.
+
+        Yields
+        ------
+        :class:`dict`
+            Maps every gene to one of its alleles.
+
         """
 
-        genes = defaultdict(list)
-        topology_graphs = (
-            record.get_topology_graph() for record in records
-        )
-        for topology_graph in topology_graphs:
-            for allele in topology_graph.get_building_blocks():
-                genes[self._get_gene(allele)].append(allele)
-        return it.product(*genes.values())
+        alleles = defaultdict(list)
+        for building_block, gene in genes.items():
+            alleles[gene].append(building_block)
+        for combination in it.product(*alleles.values()):
+            yield dict(zip(alleles, combination))
+
+
+def _is_unchanged(building_block_map):
+    """
+    Check if `building_block_map` replaces no building blocks.
+
+    Parameters
+    ----------
+    building_block_map : :class:`dict`
+        Maps building blocks to their replacements.
+
+    Returns
+    -------
+    :class:`bool`
+        ``True`` if every building block is mapped to itself.
+
+    """
+
+    return all(
+        building_block is replacement
+        for building_block, replacement in building_block_map.items()
+    )
@@ -98,7 +98,11 @@ class EvolutionaryAlgorithm:
 
         num_processes : :class:`int`, optional
             The number of parallel processes the EA should create.
-            If ``None``, all available cores will be used.
+            If ``None``, all available cores will be used. Fitness
+            calculation and the construction of crossover offspring
+            are done in parallel. The crossovers themselves are done
+            in the main process, so a random crosser makes the same
+            choices as it would in a serial run.
 
         """
 
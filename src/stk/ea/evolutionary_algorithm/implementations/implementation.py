@@ -6,9 +6,11 @@ Evolutionary Algorithm Implementation
 
 import itertools as it
 
+from stk.molecular import ConstructedMolecule
 from stk.utilities import dedupe
 
 from ...generation import Generation
+from ...utilities import CachedKeyMaker
 
 
 class Implementation:
@@ -47,11 +49,18 @@ class Implementation:
         self._logger = logger
 
     def _get_generations(self, num_generations, map_):
+        # Resolve the methods called for every record or batch once.
+        mutate = self._mutator.mutate
+
         def get_mutation_record(batch):
-            return self._mutator.mutate(batch[0])
+            return mutate(batch[0])
+
+        # Holds the keys of the molecules in the current population,
+        # so that only the keys of new molecules need to be made.
+        key_maker = CachedKeyMaker(self._key_maker)
 
         def get_key(record):
-            return self._key_maker.get_key(record.get_molecule())
+            return key_maker.get_key(record.get_molecule())
 
         population = self._initial_population
 
@@ -71,12 +80,15 @@ class Implementation:
         )
 
         for generation in range(1, num_generations):
-            self._logger.info(f"Starting generation {generation}.")
-            self._logger.info(f"Population size is {len(population)}.")
+            self._logger.info("Starting generation %d.", generation)
+            self._logger.info(
+                "Population size is %d.", len(population)
+            )
 
             self._logger.info("Doing crossovers.")
-            crossover_records = tuple(
-                self._get_crossover_records(population)
+            crossover_records = self._get_crossover_records(
+                map_=map_,
+                population=population,
             )
 
             self._logger.info("Doing mutations.")
@@ -123,6 +135,10 @@ class Implementation:
                     population
                 )
             )
+            # Forget the molecules which did not survive.
+            key_maker.retain(
+                record.get_molecule() for record in population
+            )
 
             yield Generation(
                 molecule_records=population,
@@ -130,9 +146,44 @@ class Implementation:
                 crossover_records=crossover_records,
             )
 
-    def _get_crossover_records(self, population):
-        for batch in self._crossover_selector.select(population):
-            yield from self._crosser.cross(batch)
+    def _get_crossover_records(self, map_, population):
+        cross = self._crosser.cross
+
+        # Selection is finished before any crossover is started, so
+        # that the parents do not depend on how crossovers are
+        # scheduled and every process can start right away.
+        batches = tuple(self._crossover_selector.select(population))
+        # The crossovers themselves are done in this process, so that
+        # the state of the crosser, such as a random number generator,
+        # carries over between batches and generations.
+        crossover_records = tuple(
+            crossover_record
+            for batch in batches
+            for crossover_record in cross(batch)
+        )
+        # A crosser may yield the same record more than once, or
+        # yield a record it made in an earlier generation, so only
+        # the records which are not yet constructed are kept.
+        molecule_records = tuple(
+            record
+            for record in dedupe(
+                crossover_record.get_molecule_record()
+                for crossover_record in crossover_records
+            )
+            if not record._is_constructed()
+        )
+        # Only the construction of the offspring is handed to map_.
+        # The constructed molecules are attached to the records made
+        # in this process, so that the offspring keep sharing their
+        # topology graphs and building blocks with their parents,
+        # rather than holding copies returned by other processes.
+        topology_graphs = (
+            record.get_topology_graph() for record in molecule_records
+        )
+        molecules = map_(ConstructedMolecule, topology_graphs)
+        for record, molecule in zip(molecule_records, molecules):
+            record._with_molecule(molecule)
+        return crossover_records
 
     def _with_fitness_values(self, map_, population):
         molecules = (record.get_molecule() for record in population)
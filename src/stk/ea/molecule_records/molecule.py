@@ -18,6 +18,13 @@ class MoleculeRecord:
     purely for convenience. Subclasses can freely ignore or
     override this implementation.
 
+    The molecule of a record is not constructed when the record is
+    created, but the first time :meth:`.get_molecule` is called. This
+    means that any error raised during construction comes from
+    :meth:`.get_molecule`, rather than from the initializer. Clones
+    of a record share its molecule, so :meth:`.clone` constructs the
+    molecule first, if it has not been constructed yet.
+
     """
 
     def __init__(self, topology_graph):
@@ -28,10 +35,12 @@ class MoleculeRecord:
         ----------
         topology_graph : :class:`.TopologyGraph`
             The topology graph of a :class:`.ConstructedMolecule`.
+            The molecule is constructed the first time it is
+            requested with :meth:`.get_molecule`.
 
         """
 
-        self._molecule = ConstructedMolecule(topology_graph)
+        self._molecule = None
         self._topology_graph = topology_graph
         self._fitness_value = None
         self._normalized_fitness_value = None
@@ -47,6 +56,8 @@ class MoleculeRecord:
 
         """
 
+        if self._molecule is None:
+            self._molecule = ConstructedMolecule(self._topology_graph)
         return self._molecule
 
     def get_topology_graph(self):
@@ -103,7 +114,7 @@ class MoleculeRecord:
         """
 
         clone = self.__class__.__new__(self.__class__)
-        clone._molecule = self._molecule
+        clone._molecule = self.get_molecule()
         clone._topology_graph = self._topology_graph
         clone._fitness_value = self._fitness_value
         clone._normalized_fitness_value = (
@@ -137,6 +148,42 @@ class MoleculeRecord:
             normalized=normalized,
         )
 
+    def _is_constructed(self):
+        """
+        Check if the molecule of the record has been constructed.
+
+        Returns
+        -------
+        :class:`bool`
+            ``True`` if the molecule has been constructed.
+
+        """
+
+        return self._molecule is not None
+
+    def _with_molecule(self, molecule):
+        """
+        Set the molecule held by the record.
+
+        This is used when the molecule of the record has been
+        constructed somewhere else, such as in another process.
+
+        Parameters
+        ----------
+        molecule : :class:`.ConstructedMolecule`
+            The molecule constructed from the topology graph of the
+            record.
+
+        Returns
+        -------
+        :class:`.MoleculeRecord`
+            The record.
+
+        """
+
+        self._molecule = molecule
+        return self
+
     def _with_fitness_value(self, fitness_value, normalized):
         if not normalized:
             self._fitness_value = fitness_value
@@ -109,7 +109,7 @@ class RandomBuildingBlock(MoleculeMutator):
         replaceable_building_blocks = tuple(
             filter(
                 self._is_replaceable,
-                record.get_molecule().get_building_blocks(),
+                record.get_topology_graph().get_building_blocks(),
             )
         )
         replaced_building_block = self._generator.choice(
@@ -117,6 +117,10 @@ class SimilarBuildingBlock(MoleculeMutator):
         self._name = name
         self._generator = np.random.RandomState(random_seed)
         self._similar_building_blocks = {}
+        # Maps the key of a replaced building block to the
+        # building blocks in `building_blocks`, ordered by their
+        # similarity to it.
+        self._similarity_rankings = {}
 
     def mutate(self, record):
         key = self._key_maker.get_key(record.get_molecule())
@@ -133,7 +137,7 @@ class SimilarBuildingBlock(MoleculeMutator):
         replaceable_building_blocks = tuple(
             filter(
                 self._is_replaceable,
-                record.get_molecule().get_building_blocks(),
+                record.get_topology_graph().get_building_blocks(),
             )
         )
         replaced_building_block = self._generator.choice(
@@ -146,12 +150,9 @@ class SimilarBuildingBlock(MoleculeMutator):
         replaced_key = self._key_maker.get_key(replaced_building_block)
         if replaced_key not in similar_building_blocks:
             similar_building_blocks[replaced_key] = iter(
-                sorted(
-                    self._building_blocks,
-                    key=partial(
-                        dice_similarity, replaced_building_block
-                    ),
-                    reverse=True,
+                self._get_similar_building_blocks(
+                    replaced_key=replaced_key,
+                    building_block=replaced_building_block,
                 )
             )
 
@@ -159,12 +160,9 @@ class SimilarBuildingBlock(MoleculeMutator):
             replacement = next(similar_building_blocks[replaced_key])
         except StopIteration:
             similar_building_blocks[replaced_key] = iter(
-                sorted(
-                    self._building_blocks,
-                    key=partial(
-                        dice_similarity, replaced_building_block
-                    ),
-                    reverse=True,
+                self._get_similar_building_blocks(
+                    replaced_key=replaced_key,
+                    building_block=replaced_building_block,
                 )
             )
             replacement = next(similar_building_blocks[replaced_key])
@@ -178,13 +176,9 @@ class SimilarBuildingBlock(MoleculeMutator):
                 )
             except StopIteration:
                 similar_building_blocks[replaced_key] = iter(
-                    sorted(
-                        self._building_blocks,
-                        key=partial(
-                            dice_similarity,
-                            replaced_building_block,
-                        ),
-                        reverse=True,
+                    self._get_similar_building_blocks(
+                        replaced_key=replaced_key,
+                        building_block=replaced_building_block,
                     )
                 )
                 replacement = next(
@@ -201,3 +195,40 @@ class SimilarBuildingBlock(MoleculeMutator):
             molecule_record=MoleculeRecord(graph),
             mutator_name=self._name,
         )
+
+    def _get_similar_building_blocks(
+        self,
+        replaced_key,
+        building_block,
+    ):
+        """
+        Get `building_blocks` sorted by similarity to `building_block`.
+
+        The order only depends on the replaced building block, so it
+        is calculated once and reused for every later mutation.
+
+        Parameters
+        ----------
+        replaced_key : :class:`object`
+            The key of `building_block`.
+
+        building_block : :class:`.BuildingBlock`
+            The building block being replaced.
+
+        Returns
+        -------
+        :class:`tuple` of :class:`.BuildingBlock`
+            The building blocks in `building_blocks`, from most
+            to least similar.
+
+        """
+
+        if replaced_key not in self._similarity_rankings:
+            self._similarity_rankings[replaced_key] = tuple(
+                sorted(
+                    self._building_blocks,
+                    key=partial(dice_similarity, building_block),
+                    reverse=True,
+                )
+            )
+        return self._similarity_rankings[replaced_key]
@@ -166,7 +166,7 @@ class SelectionPlotter:
         @wraps(select)
         def inner(population, *args, **kwargs):
 
-            counter = Counter({record: 0 for record in population})
+            counter = Counter(dict.fromkeys(population, 0))
             for selected in select(population, *args, **kwargs):
                 counter.update(selected)
                 yield selected
@@ -195,21 +195,17 @@ class SelectionPlotter:
 
         self._plots += 1
         sns.set(style="darkgrid")
-        data = []
-        for record, selection_count in counter.items():
-            label = self._record_label(record)
-            data.append(
-                pd.DataFrame(
-                    data={
-                        self._x_label: label,
-                        "Number of Times Selected": selection_count,
-                        "order": self._order_by(record),
-                        "heat_map": self._heat_map_value(record),
-                    },
-                    index=[self._x_label],
-                )
-            )
-        df = pd.concat(data, ignore_index=True)
+        records = tuple(counter)
+        df = pd.DataFrame(
+            data={
+                self._x_label: list(map(self._record_label, records)),
+                "Number of Times Selected": list(
+                    map(counter.get, records),
+                ),
+                "order": list(map(self._order_by, records)),
+                "heat_map": list(map(self._heat_map_value, records)),
+            },
+        )
 
         df = df.sort_values(
             ["Number of Times Selected", "order"],
@@ -229,7 +225,7 @@ class SelectionPlotter:
             hue="heat_map",
             palette="magma_r",
             data=df,
-            s=[200 for i in range(len(counter.keys()))],
+            s=[200] * len(counter),
             ax=ax,
         )
         ax.get_legend().remove()
@@ -164,14 +164,19 @@ class Roulette(Selector):
         )
 
     def _select_from_batches(self, batches, yielded_batches):
+        # Batches are picked by index, using fitness values which only
+        # need to be collected again when batches get removed.
+        fitness_values = self._get_batch_fitness_values(
+            batches=batches,
+        )
         while (
             batches and yielded_batches.get_num() < self._num_batches
         ):
-            total = sum(batch.get_fitness_value() for batch in batches)
-            weights = [
-                batch.get_fitness_value() / total for batch in batches
-            ]
-            yield self._generator.choice(batches, p=weights)
+            index = self._generator.choice(
+                a=len(batches),
+                p=fitness_values / fitness_values.sum(),
+            )
+            yield batches[index]
 
             if not self._duplicate_molecules:
                 batches = filter(
@@ -188,3 +193,12 @@ class Roulette(Selector):
                 or not self._duplicate_batches
             ):
                 batches = tuple(batches)
+                fitness_values = self._get_batch_fitness_values(
+                    batches=batches,
+                )
+
+    def _get_batch_fitness_values(self, batches):
+        return np.array(
+            [batch.get_fitness_value() for batch in batches],
+            dtype=np.float64,
+        )
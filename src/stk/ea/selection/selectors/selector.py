@@ -23,6 +23,7 @@ stk.ea.selection.selectors.stochastic_universal_sampling\
 import itertools as it
 import logging
 
+from ...utilities import CachedKeyMaker
 from ..batch import Batch
 from .utilities import YieldedBatches
 
@@ -135,16 +136,20 @@ class Selector:
 
         """
 
+        # Every molecule is placed into many batches, so make sure
+        # its key is only calculated once.
+        key_maker = CachedKeyMaker(self._key_maker)
         batches = tuple(
             self._get_batches(
                 population=population,
                 fitness_values=self._fitness_modifier(population),
                 included_batches=included_batches,
                 excluded_batches=excluded_batches,
+                key_maker=key_maker,
             )
         )
 
-        yielded_batches = YieldedBatches(self._key_maker)
+        yielded_batches = YieldedBatches(key_maker)
         for batch in self._select_from_batches(
             batches=batches,
             yielded_batches=yielded_batches,
@@ -154,7 +159,9 @@ class Selector:
 
         cls_name = self.__class__.__name__
         logger.debug(
-            f"{cls_name} yielded {yielded_batches.get_num()} batches."
+            "%s yielded %d batches.",
+            cls_name,
+            yielded_batches.get_num(),
         )
 
     def _get_batches(
@@ -163,6 +170,7 @@ class Selector:
         fitness_values,
         included_batches,
         excluded_batches,
+        key_maker,
     ):
         """
         Get batches molecules from `population`.
@@ -186,6 +194,9 @@ class Selector:
             yielded. If ``None``, no batch is forbidden from being
             yielded.
 
+        key_maker : :class:`.MoleculeKeyMaker`
+            Used to make the identity keys of the batches.
+
         Yields
         ------
         :class:`.Batch`
@@ -207,7 +218,7 @@ class Selector:
             batch = Batch(
                 records=records,
                 fitness_values=fitness_values,
-                key_maker=self._key_maker,
+                key_maker=key_maker,
             )
             if is_included(batch) and not is_excluded(batch):
                 yield batch
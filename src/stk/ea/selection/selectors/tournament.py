@@ -133,9 +133,9 @@ class Tournament(Selector):
                 low=2, high=len(batches) + 1
             )
             competitors = self._generator.choice(
-                a=batches, size=tournament_size, replace=False
+                a=len(batches), size=tournament_size, replace=False
             )
-            yield max(competitors)
+            yield max(batches[index] for index in competitors)
 
             if not self._duplicate_molecules:
                 batches = filter(
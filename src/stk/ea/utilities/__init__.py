@@ -0,0 +1 @@
+from .cached_key_maker import *  # noqa
@@ -0,0 +1,82 @@
+"""
+Cached Key Maker
+================
+
+"""
+
+
+class CachedKeyMaker:
+    """
+    Makes molecule keys, making each one only once.
+
+    Molecules are cached by identity, so this is meant to be used
+    where the same molecule objects are seen many times, such as
+    during a single :meth:`.Selector.select` call, where the same
+    molecules are placed into many different batches. Keys which are
+    no longer needed can be dropped with :meth:`.retain`.
+
+    """
+
+    __slots__ = ("_key_maker", "_keys")
+
+    def __init__(self, key_maker):
+        """
+        Initialize a :class:`.CachedKeyMaker` instance.
+
+        Parameters
+        ----------
+        key_maker : :class:`.MoleculeKeyMaker`
+            Makes the keys which get cached.
+
+        """
+
+        self._key_maker = key_maker
+        # Maps each molecule seen so far to its key.
+        self._keys = {}
+
+    def get_key(self, molecule):
+        """
+        Get the key of `molecule`.
+
+        Parameters
+        ----------
+        molecule : :class:`.Molecule`
+            The molecule for which a key is needed.
+
+        Returns
+        -------
+        :class:`object`
+            The key of `molecule`.
+
+        """
+
+        key = self._keys.get(molecule)
+        if key is None:
+            key = self._keys[molecule] = self._key_maker.get_key(
+                molecule=molecule,
+            )
+        return key
+
+    def retain(self, molecules):
+        """
+        Forget the keys of all molecules except `molecules`.
+
+        Parameters
+        ----------
+        molecules : :class:`iterable` of :class:`.Molecule`
+            The molecules whose keys are kept, if they have been made.
+
+        Returns
+        -------
+        :class:`CachedKeyMaker`
+            The key maker.
+
+        """
+
+        keys = self._keys
+        self._keys = {
+            molecule: keys[molecule]
+            for molecule in molecules
+            if molecule in keys
+        }
+        return self
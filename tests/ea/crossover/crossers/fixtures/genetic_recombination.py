@@ -13,6 +13,107 @@ bb4 = stk.BuildingBlock("BrCC(CNCBr)CBr", [stk.BromoFactory()])
 graph2 = stk.cage.EightPlusTwelve((bb3, bb4))
 
 
+def _get_crossover_records():
+    return (
+        stk.CrossoverRecord(
+            molecule_record=stk.MoleculeRecord(
+                topology_graph=graph1.with_building_blocks(
+                    building_block_map={bb1: bb3},
+                ),
+            ),
+            crosser_name="GeneticRecombination",
+        ),
+        stk.CrossoverRecord(
+            molecule_record=stk.MoleculeRecord(
+                topology_graph=graph1.with_building_blocks(
+                    building_block_map={bb2: bb4},
+                ),
+            ),
+            crosser_name="GeneticRecombination",
+        ),
+        stk.CrossoverRecord(
+            molecule_record=stk.MoleculeRecord(
+                topology_graph=graph1.with_building_blocks(
+                    building_block_map={
+                        bb1: bb3,
+                        bb2: bb4,
+                    },
+                )
+            ),
+            crosser_name="GeneticRecombination",
+        ),
+        stk.CrossoverRecord(
+            molecule_record=stk.MoleculeRecord(
+                topology_graph=graph2.with_building_blocks(
+                    building_block_map={
+                        bb3: bb1,
+                        bb4: bb2,
+                    },
+                )
+            ),
+            crosser_name="GeneticRecombination",
+        ),
+        stk.CrossoverRecord(
+            molecule_record=stk.MoleculeRecord(
+                topology_graph=graph2.with_building_blocks(
+                    building_block_map={bb4: bb2},
+                )
+            ),
+            crosser_name="GeneticRecombination",
+        ),
+        stk.CrossoverRecord(
+            molecule_record=stk.MoleculeRecord(
+                topology_graph=graph2.with_building_blocks(
+                    building_block_map={bb3: bb1},
+                )
+            ),
+            crosser_name="GeneticRecombination",
+        ),
+    )
+
+
+def _get_clone_case_data():
+    # A parent crossed with a clone of itself shares its topology
+    # graph, which must only be used once.
+    record = stk.MoleculeRecord(graph1)
+    return CaseData(
+        crosser=stk.GeneticRecombination(
+            get_gene=stk.BuildingBlock.get_num_functional_groups,
+        ),
+        records=(
+            record,
+            record.clone(),
+            stk.MoleculeRecord(graph2),
+        ),
+        crossover_records=_get_crossover_records(),
+    )
+
+
+def _get_equal_building_blocks_case_data():
+    # Building blocks are compared by identity, so parents made from
+    # equal, but different, building blocks produce offspring which
+    # are copies of the parents.
+    bb1_copy = stk.BuildingBlock("BrCCBr", [stk.BromoFactory()])
+    bb2_copy = stk.BuildingBlock("BrCC(CBr)CBr", [stk.BromoFactory()])
+    graph1_copy = stk.cage.FourPlusSix((bb1_copy, bb2_copy))
+    return CaseData(
+        crosser=stk.GeneticRecombination(
+            get_gene=stk.BuildingBlock.get_num_functional_groups,
+        ),
+        records=(
+            stk.MoleculeRecord(graph1),
+            stk.MoleculeRecord(graph1_copy),
+        ),
+        crossover_records=tuple(
+            stk.CrossoverRecord(
+                molecule_record=stk.MoleculeRecord(graph1),
+                crosser_name="GeneticRecombination",
+            )
+            for _ in range(6)
+        ),
+    )
+
+
 @pytest.fixture(
     scope="session",
     params=(
@@ -24,75 +125,10 @@ graph2 = stk.cage.EightPlusTwelve((bb3, bb4))
                 stk.MoleculeRecord(graph1),
                 stk.MoleculeRecord(graph2),
             ),
-            crossover_records=(
-                stk.CrossoverRecord(
-                    molecule_record=stk.MoleculeRecord(
-                        topology_graph=graph1,
-                    ),
-                    crosser_name="GeneticRecombination",
-                ),
-                stk.CrossoverRecord(
-                    molecule_record=stk.MoleculeRecord(
-                        topology_graph=graph1.with_building_blocks(
-                            building_block_map={bb1: bb3},
-                        ),
-                    ),
-                    crosser_name="GeneticRecombination",
-                ),
-                stk.CrossoverRecord(
-                    molecule_record=stk.MoleculeRecord(
-                        topology_graph=graph1.with_building_blocks(
-                            building_block_map={bb2: bb4},
-                        ),
-                    ),
-                    crosser_name="GeneticRecombination",
-                ),
-                stk.CrossoverRecord(
-                    molecule_record=stk.MoleculeRecord(
-                        topology_graph=graph1.with_building_blocks(
-                            building_block_map={
-                                bb1: bb3,
-                                bb2: bb4,
-                            },
-                        )
-                    ),
-                    crosser_name="GeneticRecombination",
-                ),
-                stk.CrossoverRecord(
-                    molecule_record=stk.MoleculeRecord(
-                        topology_graph=graph2.with_building_blocks(
-                            building_block_map={
-                                bb3: bb1,
-                                bb4: bb2,
-                            },
-                        )
-                    ),
-                    crosser_name="GeneticRecombination",
-                ),
-                stk.CrossoverRecord(
-                    molecule_record=stk.MoleculeRecord(
-                        topology_graph=graph2.with_building_blocks(
-                            building_block_map={bb4: bb2},
-                        )
-                    ),
-                    crosser_name="GeneticRecombination",
-                ),
-                stk.CrossoverRecord(
-                    molecule_record=stk.MoleculeRecord(
-                        topology_graph=graph2.with_building_blocks(
-                            building_block_map={bb3: bb1},
-                        )
-                    ),
-                    crosser_name="GeneticRecombination",
-                ),
-                stk.CrossoverRecord(
-                    molecule_record=stk.MoleculeRecord(
-                        topology_graph=graph2,
-                    ),
-                    crosser_name="GeneticRecombination",
-                ),
-            ),
+            crossover_records=_get_crossover_records(),
         ),
+        _get_clone_case_data,
+        _get_equal_building_blocks_case_data,
     ),
 )
 def genetic_recombination(request) -> CaseData:
@@ -31,12 +31,6 @@ graph2 = stk.cage.EightPlusTwelve((bb3, bb4))
                 stk.MoleculeRecord(graph2),
             ),
             crossover_records=(
-                stk.CrossoverRecord(
-                    molecule_record=stk.MoleculeRecord(
-                        topology_graph=graph1,
-                    ),
-                    crosser_name="GeneticRecombination",
-                ),
                 stk.CrossoverRecord(
                     molecule_record=stk.MoleculeRecord(
                         topology_graph=graph1.with_building_blocks(
@@ -91,12 +85,6 @@ graph2 = stk.cage.EightPlusTwelve((bb3, bb4))
                     ),
                     crosser_name="GeneticRecombination",
                 ),
-                stk.CrossoverRecord(
-                    molecule_record=stk.MoleculeRecord(
-                        topology_graph=graph2,
-                    ),
-                    crosser_name="GeneticRecombination",
-                ),
             ),
         ),
     ),
@@ -45,10 +45,9 @@ def _test_cross(crosser, records, crossover_records):
 
     """
 
-    for record1, record2 in zip(
-        crosser.cross(records),
-        crossover_records,
-    ):
+    results = tuple(crosser.cross(records))
+    assert len(results) == len(crossover_records)
+    for record1, record2 in zip(results, crossover_records):
         assert record1.get_crosser_name() == record2.get_crosser_name()
         is_equivalent(
             record1.get_molecule_record().get_molecule(),
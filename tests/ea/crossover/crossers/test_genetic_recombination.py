@@ -0,0 +1,33 @@
+import stk
+
+from .fixtures.genetic_recombination import graph1, graph2
+
+
+def test_offspring_reuse():
+    """
+    Test that repeated crossovers yield the earlier offspring.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    crosser = stk.GeneticRecombination(
+        get_gene=stk.BuildingBlock.get_num_functional_groups,
+    )
+    records = (
+        stk.MoleculeRecord(graph1),
+        stk.MoleculeRecord(graph2),
+    )
+    offspring1 = _get_molecule_records(crosser.cross(records))
+    offspring2 = _get_molecule_records(crosser.cross(records))
+    assert len(offspring1) == len(offspring2)
+    for record1, record2 in zip(offspring1, offspring2):
+        assert record1 is record2
+
+
+def _get_molecule_records(crossover_records):
+    return tuple(
+        record.get_molecule_record() for record in crossover_records
+    )
@@ -0,0 +1,45 @@
+import stk
+
+from ..utilities.counting_key_maker import CountingKeyMaker
+from .utilities import get_evolutionary_algorithm
+
+
+def test_key_reuse():
+    """
+    Test that the EA makes the key of each molecule only once.
+
+    Molecules which survive into the next generation must have their
+    keys reused, rather than made again.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    key_maker = CountingKeyMaker()
+    ea = get_evolutionary_algorithm(
+        crossover_selector=stk.Roulette(
+            num_batches=3,
+            batch_size=2,
+            random_seed=7,
+        ),
+        key_maker=key_maker,
+    )
+    generations = tuple(ea.get_generations(4))
+    for molecule in key_maker.molecules:
+        assert key_maker.get_num_calls(molecule) == 1
+
+    # Make sure molecules survived between generations, so the test
+    # is not passing vacuously.
+    molecule_ids = tuple(
+        {
+            id(record.get_molecule())
+            for record in generation.get_molecule_records()
+        }
+        for generation in generations[1:]
+    )
+    assert any(
+        previous & current
+        for previous, current in zip(molecule_ids, molecule_ids[1:])
+    )
@@ -0,0 +1,60 @@
+import stk
+
+from .utilities import get_evolutionary_algorithm
+
+
+def test_parallel_crossover():
+    """
+    Test that a parallel EA makes the same crossovers as a serial one.
+
+    A seeded :class:`.RandomCrosser` must make the same sequence of
+    choices, no matter how many processes are used. In particular,
+    its choices must not be repeated for every chunk of work sent to
+    a process, or restarted every generation.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    serial = _get_crosser_names(num_processes=1)
+    parallel = _get_crosser_names(num_processes=2)
+    assert serial == parallel
+    # Make sure the crossovers differ between generations, so the
+    # test is not passing vacuously.
+    assert len(set(serial[1:])) > 1
+
+
+def _get_crosser_names(num_processes):
+    """
+    Get the names of the crossers used in each generation of an EA.
+
+    Parameters
+    ----------
+    num_processes : :class:`int`
+        The number of processes the EA should use.
+
+    Returns
+    -------
+    :class:`tuple` of :class:`tuple` of :class:`str`
+        For each generation, the name of the crosser used for each
+        crossover record, in order.
+
+    """
+
+    ea = get_evolutionary_algorithm(
+        crossover_selector=stk.Roulette(
+            num_batches=6,
+            batch_size=2,
+            random_seed=7,
+        ),
+        num_processes=num_processes,
+    )
+    return tuple(
+        tuple(
+            record.get_crosser_name()
+            for record in generation.get_crossover_records()
+        )
+        for generation in ea.get_generations(4)
+    )
@@ -0,0 +1,72 @@
+from collections import Counter
+
+import stk
+
+from .utilities import (
+    get_evolutionary_algorithm,
+    get_functional_group_type,
+)
+
+
+class _RecordingCrosser:
+    """
+    Records every batch it crosses and the offspring it made.
+
+    """
+
+    def __init__(self, crosser):
+        self._crosser = crosser
+        self.crossovers = []
+
+    def cross(self, records):
+        offspring = tuple(self._crosser.cross(records))
+        self.crossovers.append((tuple(records), offspring))
+        return offspring
+
+
+def test_parent_duplicates():
+    """
+    Test that a parallel EA does not rebuild parents in crossover.
+
+    Offspring built on the topology graph of a parent are only made if
+    they replace a building block of that parent. This requires the
+    records of the EA to keep sharing their building blocks, even
+    after offspring are constructed in other processes.
+
+    Each parent is crossed with one other parent on an equivalent
+    topology graph, so its key can be made at most once, from the
+    topology graph of the other parent.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    crosser = _RecordingCrosser(
+        crosser=stk.GeneticRecombination(
+            get_gene=get_functional_group_type,
+        ),
+    )
+    ea = get_evolutionary_algorithm(
+        crossover_selector=stk.Roulette(
+            num_batches=3,
+            batch_size=2,
+            random_seed=7,
+        ),
+        num_processes=2,
+        crosser=crosser,
+    )
+    for _ in ea.get_generations(4):
+        pass
+
+    inchi = stk.Inchi()
+    assert crosser.crossovers
+    for parents, offspring in crosser.crossovers:
+        offspring_keys = Counter(
+            inchi.get_key(record.get_molecule_record().get_molecule())
+            for record in offspring
+        )
+        for parent in parents:
+            parent_key = inchi.get_key(parent.get_molecule())
+            assert offspring_keys[parent_key] <= 1
@@ -0,0 +1,124 @@
+import stk
+
+_amines = (
+    stk.BuildingBlock("NCCN", [stk.PrimaryAminoFactory()]),
+    stk.BuildingBlock("NCCCN", [stk.PrimaryAminoFactory()]),
+    stk.BuildingBlock("NCCCCN", [stk.PrimaryAminoFactory()]),
+    stk.BuildingBlock("NCOCN", [stk.PrimaryAminoFactory()]),
+)
+_aldehydes = (
+    stk.BuildingBlock("O=CCC=O", [stk.AldehydeFactory()]),
+    stk.BuildingBlock("O=CCCC=O", [stk.AldehydeFactory()]),
+    stk.BuildingBlock("O=CCCCC=O", [stk.AldehydeFactory()]),
+    stk.BuildingBlock("O=CCOCC=O", [stk.AldehydeFactory()]),
+)
+
+
+def get_functional_group_type(building_block):
+    (fg,) = building_block.get_functional_groups(0)
+    return type(fg)
+
+
+def is_amine(building_block):
+    fg_type = get_functional_group_type(building_block)
+    return fg_type is stk.PrimaryAmino
+
+
+def get_num_atoms(molecule):
+    return molecule.get_num_atoms()
+
+
+def get_initial_population():
+    """
+    Get an initial population for an EA.
+
+    Returns
+    -------
+    :class:`tuple` of :class:`.MoleculeRecord`
+        The population.
+
+    """
+
+    return tuple(
+        stk.MoleculeRecord(
+            topology_graph=stk.polymer.Linear(
+                building_blocks=(amine, aldehyde),
+                repeating_unit="AB",
+                num_repeating_units=1,
+            ),
+        )
+        for amine, aldehyde in zip(_amines, _aldehydes)
+    )
+
+
+def get_evolutionary_algorithm(
+    crossover_selector,
+    num_processes=1,
+    key_maker=stk.Inchi(),
+    crosser=None,
+):
+    """
+    Get an EA, whose random components are all seeded.
+
+    Parameters
+    ----------
+    crossover_selector : :class:`.Selector`
+        Selects molecules for crossover.
+
+    num_processes : :class:`int`, optional
+        The number of processes the EA should use.
+
+    key_maker : :class:`.MoleculeKeyMaker`, optional
+        Used to detect duplicate molecules in the EA.
+
+    crosser : :class:`.MoleculeCrosser`, optional
+        Carries out crossover operations. If ``None``, a
+        :class:`.RandomCrosser` is used.
+
+    Returns
+    -------
+    :class:`.EvolutionaryAlgorithm`
+        The EA.
+
+    """
+
+    if crosser is None:
+        crosser = stk.RandomCrosser(
+            crossers=(
+                stk.GeneticRecombination(
+                    get_gene=get_functional_group_type,
+                    name="A",
+                ),
+                stk.GeneticRecombination(
+                    get_gene=get_functional_group_type,
+                    name="B",
+                ),
+                stk.GeneticRecombination(
+                    get_gene=get_functional_group_type,
+                    name="C",
+                ),
+            ),
+            random_seed=4,
+        )
+
+    return stk.EvolutionaryAlgorithm(
+        initial_population=get_initial_population(),
+        fitness_calculator=stk.FitnessFunction(get_num_atoms),
+        mutator=stk.RandomBuildingBlock(
+            building_blocks=_amines,
+            is_replaceable=is_amine,
+            random_seed=5,
+        ),
+        crosser=crosser,
+        generation_selector=stk.Best(
+            num_batches=4,
+            duplicate_molecules=False,
+        ),
+        mutation_selector=stk.Roulette(
+            num_batches=1,
+            random_seed=6,
+        ),
+        crossover_selector=crossover_selector,
+        key_maker=key_maker,
+        num_processes=num_processes,
+    )
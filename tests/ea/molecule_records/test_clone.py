@@ -0,0 +1,24 @@
+import stk
+
+
+def test_clone():
+    """
+    Test that a record cloned before construction shares its molecule.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    record = stk.MoleculeRecord(
+        topology_graph=stk.polymer.Linear(
+            building_blocks=(
+                stk.BuildingBlock("BrCCBr", [stk.BromoFactory()]),
+            ),
+            repeating_unit="A",
+            num_repeating_units=2,
+        ),
+    )
+    clone = record.with_fitness_value(1)
+    assert clone.get_molecule() is record.get_molecule()
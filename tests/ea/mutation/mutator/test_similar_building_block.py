@@ -0,0 +1,55 @@
+import stk
+from stk.utilities import dice_similarity
+
+from .fixtures.similar_building_block import has_bromo
+
+
+def test_similarity_ranking_is_reused(monkeypatch):
+    """
+    Test that similarities are calculated once per replaced key.
+
+    Once every building block has been used as a replacement, the
+    ranking should be reused, rather than calculated again.
+
+    Parameters
+    ----------
+    monkeypatch : :class:`pytest.MonkeyPatch`
+        Used to count calls to :func:`.dice_similarity`.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    num_calls = 0
+
+    def counted_dice_similarity(mol1, mol2):
+        nonlocal num_calls
+        num_calls += 1
+        return dice_similarity(mol1, mol2)
+
+    monkeypatch.setattr(
+        "stk.ea.mutation.mutators.molecule.similar_building_block."
+        "dice_similarity",
+        counted_dice_similarity,
+    )
+
+    bb1 = stk.BuildingBlock("BrCCBr", [stk.BromoFactory()])
+    bb2 = stk.BuildingBlock("BrCNCBr", [stk.BromoFactory()])
+    bb3 = stk.BuildingBlock("BrCNNCCNCBr", [stk.BromoFactory()])
+    building_blocks = (bb2, bb3)
+    mutator = stk.SimilarBuildingBlock(
+        building_blocks=building_blocks,
+        is_replaceable=has_bromo,
+    )
+    record = stk.MoleculeRecord(
+        topology_graph=stk.polymer.Linear((bb1,), "A", 2),
+    )
+
+    # Use up the ranking more than once, so that StopIteration is
+    # hit.
+    for _ in range(2 * len(building_blocks) + 1):
+        mutator.mutate(record)
+
+    assert num_calls == len(building_blocks)
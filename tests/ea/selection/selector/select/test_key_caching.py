@@ -0,0 +1,114 @@
+import pytest
+import stk
+
+
+def _get_record(num_repeating_units, fitness_value):
+    return stk.MoleculeRecord(
+        topology_graph=stk.polymer.Linear(
+            building_blocks=(
+                stk.BuildingBlock("BrCCBr", [stk.BromoFactory()]),
+            ),
+            repeating_unit="A",
+            num_repeating_units=num_repeating_units,
+        ),
+    ).with_fitness_value(fitness_value)
+
+
+@pytest.fixture(scope="session")
+def population():
+    # Some records hold different molecule objects with the same
+    # key, so that removing duplicates has an effect.
+    return (
+        _get_record(2, 10),
+        _get_record(3, 9),
+        _get_record(2, 8),
+        _get_record(4, 5),
+        _get_record(3, 4),
+        _get_record(5, 1),
+    )
+
+
+@pytest.fixture(
+    params=(
+        lambda **kwargs: stk.Best(**kwargs),
+        lambda **kwargs: stk.Roulette(random_seed=4, **kwargs),
+        lambda **kwargs: stk.StochasticUniversalSampling(
+            random_seed=4,
+            **kwargs,
+        ),
+        lambda **kwargs: stk.Tournament(random_seed=4, **kwargs),
+    ),
+)
+def get_selector(request):
+    return request.param
+
+
+@pytest.mark.parametrize(
+    argnames=(
+        "batch_size",
+        "duplicate_molecules",
+        "duplicate_batches",
+    ),
+    argvalues=(
+        (1, False, True),
+        (1, True, False),
+        (2, False, True),
+        (2, True, False),
+    ),
+)
+def test_key_caching(
+    monkeypatch,
+    population,
+    get_selector,
+    batch_size,
+    duplicate_molecules,
+    duplicate_batches,
+):
+    """
+    Test that caching molecule keys does not change the selection.
+
+    Parameters
+    ----------
+    monkeypatch : :class:`pytest.MonkeyPatch`
+        Used to turn off the caching of keys.
+
+    population : :class:`tuple` of :class:`.MoleculeRecord`
+        The population from which batches are selected.
+
+    get_selector : :class:`callable`
+        Takes the keyword arguments of the selector and returns a new
+        selector.
+
+    batch_size : :class:`int`
+        The size of the selected batches.
+
+    duplicate_molecules : :class:`bool`
+        Toggles selection of duplicate molecules.
+
+    duplicate_batches : :class:`bool`
+        Toggles selection of duplicate batches.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    def select():
+        selector = get_selector(
+            num_batches=4,
+            batch_size=batch_size,
+            duplicate_molecules=duplicate_molecules,
+            duplicate_batches=duplicate_batches,
+        )
+        return tuple(
+            tuple(batch) for batch in selector.select(population)
+        )
+
+    cached = select()
+    # Replace the cache with the key maker it wraps.
+    monkeypatch.setattr(
+        "stk.ea.selection.selectors.selector.CachedKeyMaker",
+        lambda key_maker: key_maker,
+    )
+    assert select() == cached
@@ -0,0 +1,37 @@
+import stk
+
+
+class CountingKeyMaker(stk.Inchi):
+    """
+    Makes InChI keys, recording every molecule it makes a key for.
+
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Holds every molecule passed to get_key(), in order.
+        self.molecules = []
+
+    def get_key(self, molecule):
+        self.molecules.append(molecule)
+        return super().get_key(molecule)
+
+    def get_num_calls(self, molecule):
+        """
+        Get the number of keys made for `molecule`.
+
+        Parameters
+        ----------
+        molecule : :class:`.Molecule`
+            The molecule, compared by identity.
+
+        Returns
+        -------
+        :class:`int`
+            The number of times a key was made for `molecule`.
+
+        """
+
+        return sum(
+            1 for recorded in self.molecules if recorded is molecule
+        )
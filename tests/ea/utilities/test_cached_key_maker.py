@@ -0,0 +1,53 @@
+import stk
+from stk.ea.utilities import CachedKeyMaker
+
+from .counting_key_maker import CountingKeyMaker
+
+
+def test_get_key():
+    """
+    Test that :class:`.CachedKeyMaker` makes each key only once.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    molecule1 = stk.BuildingBlock("NCCN")
+    molecule2 = stk.BuildingBlock("NCCCN")
+    counting_key_maker = CountingKeyMaker()
+    key_maker = CachedKeyMaker(counting_key_maker)
+    inchi = stk.Inchi()
+    for _ in range(3):
+        for molecule in (molecule1, molecule2):
+            key = key_maker.get_key(molecule)
+            assert key == inchi.get_key(molecule)
+
+    assert counting_key_maker.get_num_calls(molecule1) == 1
+    assert counting_key_maker.get_num_calls(molecule2) == 1
+
+
+def test_retain():
+    """
+    Test that :meth:`.CachedKeyMaker.retain` forgets other keys.
+
+    Returns
+    -------
+    None : :class:`NoneType`
+
+    """
+
+    molecule1 = stk.BuildingBlock("NCCN")
+    molecule2 = stk.BuildingBlock("NCCCN")
+    counting_key_maker = CountingKeyMaker()
+    key_maker = CachedKeyMaker(counting_key_maker)
+    key1 = key_maker.get_key(molecule1)
+    key2 = key_maker.get_key(molecule2)
+
+    assert key_maker.retain((molecule1,)) is key_maker
+    assert key_maker.get_key(molecule1) == key1
+    assert key_maker.get_key(molecule2) == key2
+    # Only the forgotten key had to be made again.
+    assert counting_key_maker.get_num_calls(molecule1) == 1
+    assert counting_key_maker.get_num_calls(molecule2) == 2